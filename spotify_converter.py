@@ -9,20 +9,163 @@ import re
 import sys
 import json
 import os
+import shutil
 import subprocess
 import argparse
+from collections import namedtuple
+from itertools import chain
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import quote
 
+try:
+    import orjson  # Optional, much faster JSON encoder
+except ImportError:
+    orjson = None
+
+# Parenthetical/bracketed parts stripped from track titles, fused into a
+# single alternation so each title is scanned only once
+_TITLE_FUSED = re.compile(
+    r'\(feat\.[^)]*\)'
+    r'|\(ft\.[^)]*\)'
+    r'|\(with[^)]*\)'
+    r'|\([^)]*remix[^)]*\)'
+    r'|\([^)]*version[^)]*\)'
+    r'|\([^)]*edit[^)]*\)'
+    r'|\[[^\]]*\]',
+    re.IGNORECASE
+)
+
+# Patterns stripped from artist names, in order
+_ARTIST_SUBS = [
+    (re.compile(r'\s*[,&]\s*.*$'), ''),
+    (re.compile(r'\s*feat\..*$', re.IGNORECASE), ''),
+    (re.compile(r'\s*ft\..*$', re.IGNORECASE), ''),
+]
+
+# A cleaned-up song and the search term used to find it on YouTube
+Song = namedtuple('Song', 'artist title search')
+
+# Quality settings for yt-dlp
+QUALITY_SETTINGS = {
+    'best': '--audio-quality 0',
+    'good': '--audio-quality 2',
+    'fast': '--audio-quality 5'
+}
+
+# Download script written by create_download_script, filled in with
+# str.format (so literal shell braces are doubled)
+_SCRIPT_TEMPLATE = '''#!/bin/bash
+
+# Auto-generated YouTube music download script
+# Downloads songs from Spotify playlist export
+
+OUTPUT_DIR="{output_dir}"
+BATCH_FILE="{batch_file}"
+
+# Colors
+RED='\\033[0;31m'
+GREEN='\\033[0;32m'
+YELLOW='\\033[1;33m'
+BLUE='\\033[0;34m'
+NC='\\033[0m' # No Color
+
+echo -e "${{GREEN}}🎵 Starting batch music download...${{NC}}"
+echo -e "${{BLUE}}Output directory: $OUTPUT_DIR${{NC}}"
+echo -e "${{BLUE}}Batch file: $BATCH_FILE${{NC}}"
+echo -e "${{BLUE}}Audio format: {audio_format}${{NC}}"
+echo -e "${{BLUE}}Quality: {quality}${{NC}}"
+
+# Create output directory
+mkdir -p "$OUTPUT_DIR"
+
+# Count total songs
+TOTAL_SONGS=$(wc -l < "$BATCH_FILE")
+echo -e "${{YELLOW}}Total songs to download: $TOTAL_SONGS${{NC}}"
+
+# Download all songs with yt-dlp
+yt-dlp \\
+    --extract-audio \\
+    --audio-format {audio_format} \\
+    {quality_option} \\
+    --output "$OUTPUT_DIR/%(uploader)s - %(title)s.%(ext)s" \\
+    --embed-metadata \\
+    --add-metadata \\
+    --embed-thumbnail \\
+    --batch-file "$BATCH_FILE" \\
+    --ignore-errors \\
+    --no-overwrites \\
+    --continue \\
+    --retries 3 \\
+    --fragment-retries 3 \\
+    --progress \\
+    --console-title
+
+echo -e "${{GREEN}}✅ Batch download completed!${{NC}}"
+echo -e "${{YELLOW}}📁 Check $OUTPUT_DIR for your downloaded music${{NC}}"
+
+# Show download summary
+DOWNLOADED=$(find "$OUTPUT_DIR" -name "*.{audio_format}" | wc -l)
+echo -e "${{BLUE}}Downloaded: $DOWNLOADED/$TOTAL_SONGS songs${{NC}}"
+
+if [ $DOWNLOADED -lt $TOTAL_SONGS ]; then
+    echo -e "${{YELLOW}}⚠ Some songs may have failed to download. Check the log above.${{NC}}"
+fi
+'''
+
+def _deps_stamp_file():
+    """Path of the stamp marking a successful dependency check, or None
+
+    The stamp is trusted until a PATH directory changes. Resolved lazily since
+    Path.home() fails when there is no HOME or passwd entry.
+    """
+    try:
+        return Path.home() / '.cache' / 'spotify_converter' / 'deps.ok'
+    except RuntimeError:
+        return None
+
+def _deps_stamp_is_fresh():
+    """Check if the dependency stamp is newer than every PATH directory"""
+    stamp_file = _deps_stamp_file()
+    if stamp_file is None:
+        return False
+    
+    try:
+        stamp_mtime = os.stat(stamp_file).st_mtime
+    except OSError:
+        return False
+    
+    path_mtimes = [os.stat(p).st_mtime
+                   for p in os.environ.get('PATH', '').split(os.pathsep)
+                   if os.path.isdir(p)]
+    return stamp_mtime > max(path_mtimes, default=0)
+
+def _touch_deps_stamp():
+    """Record a successful dependency check"""
+    stamp_file = _deps_stamp_file()
+    if stamp_file is None:
+        return
+    
+    try:
+        stamp_file.parent.mkdir(parents=True, exist_ok=True)
+        stamp_file.touch()
+    except OSError:
+        pass  # Caching is best-effort
+
 def check_and_install_dependencies():
     """Check and install missing dependencies"""
+    if _deps_stamp_is_fresh():
+        print("✓ Dependencies already verified")
+        return
+    
     print("Checking dependencies...")
+    deps_ok = True
     
     # Check for yt-dlp
-    try:
-        subprocess.run(['yt-dlp', '--version'], capture_output=True, check=True)
+    if shutil.which('yt-dlp'):
         print("✓ yt-dlp is installed")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         print("⚠ yt-dlp not found. Installing...")
         try:
             # Try pacman first (Arch-based systems)
@@ -40,10 +183,9 @@ def check_and_install_dependencies():
                 sys.exit(1)
     
     # Check for ffmpeg (needed for audio conversion)
-    try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
+    if shutil.which('ffmpeg'):
         print("✓ ffmpeg is available")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         print("⚠ ffmpeg not found. Installing...")
         try:
             subprocess.run(['sudo', 'pacman', '-S', 'ffmpeg', '--noconfirm'], check=True)
@@ -52,84 +194,105 @@ def check_and_install_dependencies():
             print("❌ Failed to install ffmpeg. Please install manually:")
             print("  Arch: sudo pacman -S ffmpeg")
             print("  Ubuntu/Debian: sudo apt install ffmpeg")
+            deps_ok = False
+    
+    if deps_ok:
+        _touch_deps_stamp()
 
 def clean_title(title):
     """Clean up track title for better YouTube search results"""
     # Remove common problematic parts
-    title = re.sub(r'\(feat\..*?\)', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\(ft\..*?\)', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\(with.*?\)', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\(.*?remix.*?\)', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\(.*?version.*?\)', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\(.*?edit.*?\)', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\[.*?\]', '', title)
-    title = re.sub(r'\s+', ' ', title).strip()
-    return title
+    title = _TITLE_FUSED.sub('', title)
+    # Collapse runs of whitespace left behind by the removals
+    return ' '.join(title.split())
 
+@lru_cache(maxsize=4096)
 def clean_artist(artist):
-    """Clean up artist name"""
+    """Clean up artist name
+
+    Cached since large playlists repeat the same artists many times.
+    """
     # Remove featuring artists and clean up
-    artist = re.sub(r'\s*[,&]\s*.*$', '', artist)
-    artist = re.sub(r'\s*feat\..*$', '', artist, flags=re.IGNORECASE)
-    artist = re.sub(r'\s*ft\..*$', '', artist, flags=re.IGNORECASE)
+    for pattern, repl in _ARTIST_SUBS:
+        artist = pattern.sub(repl, artist)
     return artist.strip()
 
-def should_add_artist(artist, title):
-    """Check if artist name should be added to search (avoid duplication)"""
-    if not artist or artist == 'Unknown Artist':
+def should_add_artist(artist_lower, title_lower, artist_first_word):
+    """Check if artist name should be added to search (avoid duplication)
+
+    Takes the lowercased artist and title plus the artist's first word so
+    callers can compute them once per song. The 'Unknown Artist' placeholder
+    is matched case-sensitively, so callers check it on the original name.
+    """
+    if not artist_lower:
         return False
     
-    # Check if artist name is already in the title
-    artist_lower = artist.lower()
-    title_lower = title.lower()
+    # Title starting with the artist is the common case, and a prefix
+    # compare is cheaper than scanning the whole title
+    if title_lower.startswith(artist_lower):
+        return False
     
     # Direct match
     if artist_lower in title_lower:
         return False
     
     # Check for partial matches (first word of artist in title)
-    artist_first_word = artist_lower.split()[0]
     if len(artist_first_word) > 2 and artist_first_word in title_lower:
         return False
     
     return True
 
-def process_csv_export(csv_file):
-    """Process Exportify CSV file"""
-    songs = []
+def build_search(artist_name, track_name):
+    """Clean up a song and build its YouTube search term"""
+    track_name = clean_title(track_name)
+    search_term = track_name
     
+    if artist_name:
+        artist_name = clean_artist(artist_name)
+        
+        # Only add artist if it's not already in the title
+        if artist_name and artist_name != 'Unknown Artist':
+            artist_lower = artist_name.lower()
+            artist_first_word = artist_lower.split(None, 1)[0]
+            if should_add_artist(artist_lower, track_name.lower(), artist_first_word):
+                search_term = f"{artist_name} {track_name}"
+    
+    return Song(artist_name or 'Unknown Artist', track_name, search_term)
+
+def _read_csv_rows(reader, track_index, artist_index):
+    """Yield raw (artist, track) pairs from CSV rows, skipping unusable ones"""
+    for row_num, row in enumerate(reader, 1):
+        if not row:  # Skip blank lines
+            continue
+        
+        track_name = row[track_index].strip() if track_index < len(row) else ''
+        if artist_index is not None and artist_index < len(row):
+            artist_name = row[artist_index].strip()
+        else:
+            artist_name = ''
+        
+        if not track_name:
+            print(f"⚠ Row {row_num}: No track name found, skipping")
+            continue
+        
+        yield artist_name, track_name
+
+def process_csv_export(csv_file):
+    """Process Exportify CSV file, yielding songs as rows are read"""
     try:
         with open(csv_file, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row_num, row in enumerate(reader, 1):
-                # Exportify CSV has these columns
-                track_name = row.get('Track Name', '').strip()
-                artist_name = row.get('Artist Name(s)', '').strip()
-                
-                if not track_name:
-                    print(f"⚠ Row {row_num}: No track name found, skipping")
-                    continue
-                
-                # Clean up names
-                if artist_name:
-                    artist_name = clean_artist(artist_name)
-                    track_name = clean_title(track_name)
-                    
-                    # Only add artist if it's not already in the title
-                    if should_add_artist(artist_name, track_name):
-                        search_term = f"{artist_name} {track_name}"
-                    else:
-                        search_term = track_name
-                else:
-                    # If no artist, just use the track name
-                    track_name = clean_title(track_name)
-                    search_term = track_name
-                
-                songs.append({
-                    'artist': artist_name or 'Unknown Artist',
-                    'title': track_name,
-                    'search': search_term
-                })
+            reader = csv.reader(file)
+            header = next(reader, [])
+            
+            # Exportify CSV has these columns
+            if 'Track Name' not in header:
+                print(f"❌ No 'Track Name' column found in {csv_file}")
+                sys.exit(1)
+            track_index = header.index('Track Name')
+            artist_index = header.index('Artist Name(s)') if 'Artist Name(s)' in header else None
+            
+            for artist_name, track_name in _read_csv_rows(reader, track_index, artist_index):
+                yield build_search(artist_name, track_name)
                 
     except FileNotFoundError:
         print(f"❌ File not found: {csv_file}")
@@ -137,51 +300,35 @@ def process_csv_export(csv_file):
     except Exception as e:
         print(f"❌ Error reading CSV file: {e}")
         sys.exit(1)
-    
-    return songs
 
 def process_text_list(text_file):
-    """Process plain text list of songs"""
-    songs = []
-    
+    """Process plain text list of songs, yielding one song per line"""
     try:
+        # Read the whole file at once rather than line by line; text mode
+        # keeps universal newlines, so '\r' and '\r\n' become '\n'
         with open(text_file, 'r', encoding='utf-8') as file:
-            for line_num, line in enumerate(file, 1):
-                line = line.strip()
-                if not line or line.startswith('#'):  # Skip empty lines and comments
-                    continue
-                    
-                # Try to parse "Artist - Title" format
-                if ' - ' in line:
-                    parts = line.split(' - ', 1)
-                    artist_name = clean_artist(parts[0].strip())
-                    track_name = clean_title(parts[1].strip())
-                    
-                    # Only add artist if it's not already in the title
-                    if should_add_artist(artist_name, track_name):
-                        search_term = f"{artist_name} {track_name}"
-                    else:
-                        search_term = track_name
-                else:
-                    # Treat whole line as search term (no artist info)
-                    artist_name = ""
-                    track_name = clean_title(line)
-                    search_term = track_name
-                    
-                songs.append({
-                    'artist': artist_name or 'Unknown Artist',
-                    'title': track_name,
-                    'search': search_term
-                })
+            lines = file.read().split('\n')
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):  # Skip empty lines and comments
+                continue
                 
+            # Try to parse "Artist - Title" format
+            head, sep, tail = line.partition(' - ')
+            if sep:
+                artist_name, track_name = head.strip(), tail.strip()
+            else:
+                # Treat whole line as search term (no artist info)
+                artist_name, track_name = "", line
+            
+            yield build_search(artist_name, track_name)
+            
     except FileNotFoundError:
         print(f"❌ File not found: {text_file}")
         sys.exit(1)
     except Exception as e:
         print(f"❌ Error reading text file: {e}")
         sys.exit(1)
-    
-    return songs
 
 def interactive_input():
     """Get playlist information interactively"""
@@ -199,26 +346,13 @@ def interactive_input():
             if not song_input or song_input.lower() == 'q':
                 break
                 
-            if ' - ' in song_input:
-                parts = song_input.split(' - ', 1)
-                artist_name = clean_artist(parts[0].strip())
-                track_name = clean_title(parts[1].strip())
-                
-                # Only add artist if it's not already in the title
-                if should_add_artist(artist_name, track_name):
-                    search_term = f"{artist_name} {track_name}"
-                else:
-                    search_term = track_name
+            head, sep, tail = song_input.partition(' - ')
+            if sep:
+                artist_name, track_name = head.strip(), tail.strip()
             else:
-                artist_name = ""
-                track_name = clean_title(song_input)
-                search_term = track_name
-                
-            songs.append({
-                'artist': artist_name or 'Unknown Artist',
-                'title': track_name,
-                'search': search_term
-            })
+                artist_name, track_name = "", song_input
+            
+            songs.append(build_search(artist_name, track_name))
             
         except KeyboardInterrupt:
             print("\n\nOperation cancelled.")
@@ -227,105 +361,116 @@ def interactive_input():
     return songs
 
 def generate_youtube_searches(songs, search_quality='best'):
-    """Generate YouTube search URLs for each song"""
-    search_urls = []
-    
-    for song in songs:
-        # Create different search strategies based on quality setting
-        if search_quality == 'best':
-            search_query = f"{song['search']} official audio"
-        elif search_quality == 'fast':
-            search_query = song['search']
-        else:  # balanced
-            search_query = f"{song['search']} official"
-            
-        search_url = f"ytsearch1:{search_query}"
-        search_urls.append(search_url)
-        
-    return search_urls
+    """Lazily generate YouTube search URLs for each song"""
+    # Pick the search strategy once based on quality setting
+    suffix = {
+        'best': ' official audio',
+        'fast': '',
+        'balanced': ' official'
+    }.get(search_quality, ' official')
+    
+    return ("ytsearch1:" + song.search + suffix for song in songs)
+
+def dedupe_searches(search_urls):
+    """Yield each search URL once, keeping first-seen order"""
+    seen = set()
+    for url in search_urls:
+        if url not in seen:
+            seen.add(url)
+            yield url
 
 def save_yt_dlp_batch_file(search_urls, output_file='youtube_downloads.txt'):
-    """Save URLs in format for yt-dlp batch download"""
+    """Save URLs in format for yt-dlp batch download
+
+    search_urls may be any iterable, so URLs are written as they are produced.
+    Returns the file name and the number of URLs written.
+    """
+    tmp_file = output_file + '.tmp'
     try:
-        with open(output_file, 'w', encoding='utf-8') as file:
-            for url in search_urls:
+        count = 0
+        # Large buffer so the per-URL writes rarely reach the OS
+        with open(tmp_file, 'w', encoding='utf-8', buffering=1 << 20) as file:
+            for count, url in enumerate(search_urls, 1):
                 file.write(url + '\n')
         
-        print(f"✓ Created {output_file} with {len(search_urls)} songs")
-        return output_file
+        # Only replace an existing batch file once all input was parsed
+        os.replace(tmp_file, output_file)
+        print(f"✓ Created {output_file} with {count} songs")
+        return output_file, count
     except Exception as e:
         print(f"❌ Error creating batch file: {e}")
         sys.exit(1)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
 
-def create_download_script(batch_file, output_dir='./Music', audio_format='mp3', quality='best'):
-    """Create a shell script to download all songs"""
+def stream_to_yt_dlp(search_urls, output_dir='./Music', audio_format='mp3', quality='best'):
+    """Pipe search URLs straight into yt-dlp's stdin instead of a batch file
     
-    # Quality settings for yt-dlp
-    quality_settings = {
-        'best': '--audio-quality 0',
-        'good': '--audio-quality 2', 
-        'fast': '--audio-quality 5'
-    }
+    Returns the yt-dlp exit code (or 1 if it stopped reading early) and the
+    number of URLs sent.
+    """
+    quality_option = QUALITY_SETTINGS.get(quality, '--audio-quality 0')
+    command = [
+        'yt-dlp',
+        '--extract-audio',
+        '--audio-format', audio_format,
+        *quality_option.split(),
+        '--output', f"{output_dir}/%(uploader)s - %(title)s.%(ext)s",
+        '--embed-metadata',
+        '--add-metadata',
+        '--embed-thumbnail',
+        '--batch-file', '-',
+        '--ignore-errors',
+        '--no-overwrites',
+        '--continue',
+        '--retries', '3',
+        '--fragment-retries', '3',
+        '--progress',
+        '--console-title'
+    ]
     
-    quality_option = quality_settings.get(quality, '--audio-quality 0')
+    os.makedirs(output_dir, exist_ok=True)
+    try:
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, encoding='utf-8')
+    except FileNotFoundError:
+        print("❌ yt-dlp not found. Please install it first.")
+        sys.exit(1)
     
-    script_content = f'''#!/bin/bash
-
-# Auto-generated YouTube music download script
-# Downloads songs from Spotify playlist export
-
-OUTPUT_DIR="{output_dir}"
-BATCH_FILE="{batch_file}"
-
-# Colors
-RED='\\033[0;31m'
-GREEN='\\033[0;32m'
-YELLOW='\\033[1;33m'
-BLUE='\\033[0;34m'
-NC='\\033[0m' # No Color
-
-echo -e "${{GREEN}}🎵 Starting batch music download...${{NC}}"
-echo -e "${{BLUE}}Output directory: $OUTPUT_DIR${{NC}}"
-echo -e "${{BLUE}}Batch file: $BATCH_FILE${{NC}}"
-echo -e "${{BLUE}}Audio format: {audio_format}${{NC}}"
-echo -e "${{BLUE}}Quality: {quality}${{NC}}"
-
-# Create output directory
-mkdir -p "$OUTPUT_DIR"
-
-# Count total songs
-TOTAL_SONGS=$(wc -l < "$BATCH_FILE")
-echo -e "${{YELLOW}}Total songs to download: $TOTAL_SONGS${{NC}}"
-
-# Download all songs with yt-dlp
-yt-dlp \\
-    --extract-audio \\
-    --audio-format {audio_format} \\
-    {quality_option} \\
-    --output "$OUTPUT_DIR/%(uploader)s - %(title)s.%(ext)s" \\
-    --embed-metadata \\
-    --add-metadata \\
-    --embed-thumbnail \\
-    --batch-file "$BATCH_FILE" \\
-    --ignore-errors \\
-    --no-overwrites \\
-    --continue \\
-    --retries 3 \\
-    --fragment-retries 3 \\
-    --progress \\
-    --console-title
-
-echo -e "${{GREEN}}✅ Batch download completed!${{NC}}"
-echo -e "${{YELLOW}}📁 Check $OUTPUT_DIR for your downloaded music${{NC}}"
-
-# Show download summary
-DOWNLOADED=$(find "$OUTPUT_DIR" -name "*.{audio_format}" | wc -l)
-echo -e "${{BLUE}}Downloaded: $DOWNLOADED/$TOTAL_SONGS songs${{NC}}"
+    count = 0
+    try:
+        for url in search_urls:
+            process.stdin.write(url + '\n')
+            count += 1
+        process.stdin.close()
+    except BrokenPipeError:
+        print("⚠ yt-dlp exited before all songs were sent")
+        return process.wait() or 1, count
+    except BaseException:
+        # Parsing the input failed; don't leave yt-dlp downloading a partial list
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+    
+    return process.wait(), count
 
-if [ $DOWNLOADED -lt $TOTAL_SONGS ]; then
-    echo -e "${{YELLOW}}⚠ Some songs may have failed to download. Check the log above.${{NC}}"
-fi
-'''
+def create_download_script(batch_file, output_dir='./Music', audio_format='mp3', quality='best'):
+    """Create a shell script to download all songs"""
+    
+    quality_option = QUALITY_SETTINGS.get(quality, '--audio-quality 0')
+    
+    script_content = _SCRIPT_TEMPLATE.format(
+        output_dir=output_dir,
+        batch_file=batch_file,
+        audio_format=audio_format,
+        quality=quality,
+        quality_option=quality_option
+    )
     
     script_file = 'download_spotify_music.sh'
     try:
@@ -344,13 +489,19 @@ def save_playlist_info(songs, filename='playlist_info.json'):
     """Save playlist information as JSON for reference"""
     playlist_data = {
         'total_songs': len(songs),
-        'songs': songs,
-        'created_at': subprocess.check_output(['date']).decode().strip()
+        'songs': [song._asdict() for song in songs],
+        'created_at': datetime.now().astimezone().isoformat()
     }
     
     try:
-        with open(filename, 'w', encoding='utf-8') as file:
-            json.dump(playlist_data, file, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            data = orjson.dumps(playlist_data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(playlist_data, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        # Encode up front and write once
+        with open(filename, 'wb') as file:
+            file.write(data)
         print(f"✓ Saved playlist info to {filename}")
     except Exception as e:
         print(f"⚠ Could not save playlist info: {e}")
@@ -381,9 +532,16 @@ Examples:
                        help='Skip dependency checking')
     parser.add_argument('--batch-only', action='store_true',
                        help='Only create batch file, don\'t create download script')
+    parser.add_argument('--stream', action='store_true',
+                       help='Pipe searches straight into yt-dlp and start downloading now')
+    parser.add_argument('--no-dedup', action='store_true',
+                       help='Keep duplicate songs instead of searching for them once')
     
     args = parser.parse_args()
     
+    if args.stream and args.batch_only:
+        parser.error("--stream and --batch-only cannot be used together")
+    
     # Show help if no arguments provided
     if not args.input_file and not args.interactive:
         parser.print_help()
@@ -398,7 +556,7 @@ Examples:
     # Get songs based on input method
     if args.interactive:
         print("🎵 Interactive mode selected")
-        songs = interactive_input()
+        song_source = interactive_input()
     else:
         input_file = args.input_file
         if not os.path.exists(input_file):
@@ -408,32 +566,64 @@ Examples:
         # Determine file type and process accordingly
         if input_file.lower().endswith('.csv'):
             print(f"📊 Processing Spotify CSV export: {input_file}")
-            songs = process_csv_export(input_file)
+            song_source = process_csv_export(input_file)
         else:
             print(f"📝 Processing text file: {input_file}")
-            songs = process_text_list(input_file)
+            song_source = process_text_list(input_file)
     
-    if not songs:
+    # Peek at the first song so nothing is written for an empty playlist
+    song_iter = iter(song_source)
+    first_song = next(song_iter, None)
+    if first_song is None:
         print("❌ No songs found!")
         sys.exit(1)
     
+    # Songs are kept for the preview and playlist info while the batch file
+    # is written in the same pass
+    songs = []
+    
+    def record_songs(song_iter):
+        for song in song_iter:
+            songs.append(song)
+            yield song
+    
+    # Generate YouTube search URLs
+    print(f"\n🔍 Generating YouTube search URLs (quality: {args.quality})...")
+    search_urls = generate_youtube_searches(record_songs(chain([first_song], song_iter)), args.quality)
+    if not args.no_dedup:
+        search_urls = dedupe_searches(search_urls)
+    
+    if args.stream:
+        # Download as songs are parsed, no batch file or script needed
+        print(f"🚀 Streaming searches into yt-dlp (output: {args.output})...")
+        returncode, count = stream_to_yt_dlp(search_urls, args.output, args.format, args.quality)
+        
+        # yt-dlp may stop reading early; finish parsing so the info is complete
+        for _ in search_urls:
+            pass
+        save_playlist_info(songs)
+        
+        if returncode == 0:
+            print(f"\n✅ Downloaded {count} songs to {args.output}")
+        else:
+            print(f"\n⚠ yt-dlp exited with code {returncode}. Some songs may have failed to download.")
+        sys.exit(returncode)
+    
+    # Save batch file for yt-dlp
+    batch_file, count = save_yt_dlp_batch_file(search_urls)
+    
     print(f"\n✓ Found {len(songs)} songs")
+    if count < len(songs):
+        print(f"✓ Skipped {len(songs) - count} duplicates, {count} unique songs to download")
     
     # Show preview of songs
     print(f"\n🎵 Preview of songs to download:")
     for i, song in enumerate(songs[:5]):
-        artist_display = f"{song['artist']} - " if song['artist'] != 'Unknown Artist' else ""
-        print(f"  {i+1}. {artist_display}{song['title']}")
+        artist_display = f"{song.artist} - " if song.artist != 'Unknown Artist' else ""
+        print(f"  {i+1}. {artist_display}{song.title}")
     if len(songs) > 5:
         print(f"  ... and {len(songs) - 5} more")
     
-    # Generate YouTube search URLs
-    print(f"\n🔍 Generating YouTube search URLs (quality: {args.quality})...")
-    search_urls = generate_youtube_searches(songs, args.quality)
-    
-    # Save batch file for yt-dlp
-    batch_file = save_yt_dlp_batch_file(search_urls)
-    
     # Save playlist info
     save_playlist_info(songs)
     
@@ -446,7 +636,7 @@ Examples:
         print(f"  ./{script_file}")
         print(f"\n🛠 Or manually with yt-dlp:")
         print(f"  yt-dlp -x --audio-format {args.format} -a {batch_file}")
-        print(f"\n📊 This will download {len(songs)} songs as {args.format.upper()} files")
+        print(f"\n📊 This will download {count} songs as {args.format.upper()} files")
         print(f"📁 Output directory: {args.output}")
     else:
         print(f"\n📄 Batch file created: {batch_file}")